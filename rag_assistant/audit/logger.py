@@ -5,11 +5,72 @@ Logs all operations with focus on network egress tracking.
 No response bodies are logged (prevent exfiltration).
 """
 
+import atexit
 import logging
 import json
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
+
+try:
+    import orjson  # Optional: C JSON encoder, several times faster per event
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Loggers with events still to write; one shared daemon thread drains them
+# all. The strong references keep a logger (and its queued events) alive
+# until they are on disk, even if its owner has already dropped it.
+_flush_targets: "Set[AuditLogger]" = set()
+_flush_wakeup = threading.Event()
+_flusher_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+
+
+def _dumps(event: Dict[str, Any]) -> bytes:
+    """Serialize an event to one line of UTF-8 JSON, preferring orjson."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event)
+        except TypeError:
+            pass  # e.g. non-str keys or >64-bit ints, which json accepts
+    return json.dumps(event).encode('utf-8')
+
+
+def _flush_all():
+    """Write out the pending events of every live audit logger."""
+    for audit in list(_flush_targets):
+        try:
+            audit.flush()
+        except OSError as e:
+            logger.warning("Failed to write audit log %s: %s", audit.log_file, e)
+
+
+def _flush_loop():
+    """Background flusher: drain every FLUSH_INTERVAL, or early on a full batch."""
+    while True:
+        _flush_wakeup.wait(AuditLogger.FLUSH_INTERVAL)
+        _flush_wakeup.clear()
+        _flush_all()
+
+
+def _ensure_flusher():
+    """Start the shared flusher thread on first use."""
+    global _flusher
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="audit-log-flusher", daemon=True)
+            _flusher.start()
+
+
+# Daemon threads are killed at exit; write whatever is still queued
+atexit.register(_flush_all)
 
 
 class AuditLogger:
@@ -21,43 +82,82 @@ class AuditLogger:
     - Network egress tracking (URL, status, byte count, time)
     - Never logs response bodies
     - Immutable append-only log file
+    
+    Events are serialized when logged but written in batches: a background
+    thread appends everything pending every FLUSH_INTERVAL seconds, or as
+    soon as FLUSH_BATCH_SIZE events are waiting, so callers never wait on
+    the disk. Call flush() to write pending events immediately.
     """
     
+    # Wake the flusher early once this many events are pending
+    FLUSH_BATCH_SIZE = 100
+    
+    # Maximum delay (seconds) before a pending event is written
+    FLUSH_INTERVAL = 0.5
+    
+    # Back-pressure: past this many pending events the caller flushes itself
+    MAX_PENDING = 10000
+    
     def __init__(self, log_file: str = "./audit.log", level: str = "INFO"):
         """
         Initialize audit logger.
         
         Args:
             log_file: Path to audit log
-            level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            level: Logging level (DEBUG, INFO, WARNING, ERROR); events are
+                logged at INFO, so WARNING and above disable them
         """
         self.log_file = Path(log_file)
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.log_file.touch()
         
-        self.logger = logging.getLogger("rag_audit")
-        self.logger.setLevel(getattr(logging, level))
-        
-        # File handler with JSON formatting
-        fh = logging.FileHandler(self.log_file, mode='a')
-        fh.setLevel(getattr(logging, level))
-        
-        # Plain formatter (each line is a JSON event)
-        formatter = logging.Formatter('%(message)s')
-        fh.setFormatter(formatter)
-        
-        # Remove existing handlers to avoid duplicates
-        self.logger.handlers = []
-        self.logger.addHandler(fh)
+        self.enabled = getattr(logging, level) <= logging.INFO
+        self._pending = deque()  # serialized events awaiting write
+        self._write_lock = threading.Lock()  # keeps batches in order
     
-    def _log_event(self, event_dict: Dict[str, Any]):
+    def log_event(self, event_dict: Dict[str, Any]):
         """
         Log a structured event as JSON.
         
         Args:
             event_dict: Event data to log
         """
+        if not self.enabled:
+            return
+        
         event_dict['timestamp'] = datetime.utcnow().isoformat()
-        self.logger.info(json.dumps(event_dict))
+        pending = self._pending
+        pending.append(_dumps(event_dict))
+        _flush_targets.add(self)
+        _ensure_flusher()
+        
+        if len(pending) >= self.MAX_PENDING:
+            self.flush()
+        elif len(pending) % self.FLUSH_BATCH_SIZE == 0:
+            _flush_wakeup.set()
+    
+    def flush(self):
+        """
+        Append all pending events to the log file in a single write.
+        
+        If the write fails the events are put back, in order, and the
+        OSError propagates; the background flusher retries them later.
+        """
+        with self._write_lock:
+            pending = self._pending
+            if pending:
+                lines = [pending.popleft() for _ in range(len(pending))]
+                try:
+                    with open(self.log_file, 'ab') as f:
+                        f.write(b'\n'.join(lines) + b'\n')
+                except BaseException:
+                    pending.extendleft(reversed(lines))
+                    raise
+            
+            # Stay registered if events arrived while writing
+            _flush_targets.discard(self)
+            if pending:
+                _flush_targets.add(self)
     
     def log_document_ingestion(self, source_path: str, doc_type: str, 
                               num_chunks: int, **kwargs):
@@ -77,7 +177,7 @@ class AuditLogger:
             "num_chunks": num_chunks,
             **kwargs
         }
-        self._log_event(event)
+        self.log_event(event)
     
     def log_query(self, query: str, num_results: int, execution_time_ms: float, **kwargs):
         """
@@ -96,7 +196,7 @@ class AuditLogger:
             "execution_time_ms": execution_time_ms,
             **kwargs
         }
-        self._log_event(event)
+        self.log_event(event)
     
     def log_network_egress(self, method: str, url: str, status_code: int,
                           response_size: int, execution_time_ms: float, **kwargs):
@@ -122,7 +222,7 @@ class AuditLogger:
             "execution_time_ms": execution_time_ms,
             **kwargs
         }
-        self._log_event(event)
+        self.log_event(event)
     
     def log_security_violation(self, violation_type: str, details: str, **kwargs):
         """
@@ -139,7 +239,7 @@ class AuditLogger:
             "details": details,
             **kwargs
         }
-        self._log_event(event)
+        self.log_event(event)
     
     def log_model_inference(self, model_name: str, input_tokens: int,
                            output_tokens: int, inference_time_ms: float, **kwargs):
@@ -161,7 +261,7 @@ class AuditLogger:
             "inference_time_ms": inference_time_ms,
             **kwargs
         }
-        self._log_event(event)
+        self.log_event(event)
     
     def log_error(self, error_type: str, message: str, context: Optional[Dict] = None):
         """
@@ -178,7 +278,7 @@ class AuditLogger:
             "message": message,
             **(context or {})
         }
-        self._log_event(event)
+        self.log_event(event)
 
 
 def get_audit_logger(config: Optional[Dict[str, Any]] = None) -> AuditLogger:
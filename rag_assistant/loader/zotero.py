@@ -36,9 +36,11 @@ class ZoteroDocLoader(BaseDocLoader):
         chunks = []
         
         for item in items:
+            authors = item.author_string()
+            
             # Create content from item metadata
             content = f"""Title: {item.title}
-Authors: {item.author_string()}
+Authors: {authors}
 Year: {item.year or 'n.d.'}
 Type: {item.item_type}
 DOI: {item.doi or 'N/A'}
@@ -57,7 +59,7 @@ Abstract:
                 # Store Zotero metadata
                 zotero_citekey=item.citekey,
                 zotero_title=item.title,
-                zotero_authors=item.author_string(),
+                zotero_authors=authors,
                 zotero_year=item.year,
                 zotero_doi=item.doi or '',
                 zotero_item_type=item.item_type
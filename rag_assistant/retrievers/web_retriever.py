@@ -10,11 +10,16 @@ Features:
 
 import re
 import hashlib
+import os
+import uuid
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urlencode
 
 from rag_assistant.security import SecurityViolation, get_security_context
@@ -22,6 +27,32 @@ from rag_assistant.retrievers import BaseRetriever
 from rag_assistant.audit.logger import AuditLogger
 
 
+# ASCII characters outside [\w\s-] become spaces in one str.translate pass;
+# non-ASCII queries fall back to the equivalent (Unicode-aware) regex
+_SPECIAL_CHARS_TABLE = str.maketrans({
+    c: ' ' for c in map(chr, range(128))
+    if not (c.isalnum() or c.isspace() or c in '_-')
+})
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-]')
+
+
+def _drop_quoted(text: str, quote: str) -> str:
+    """Remove quote-delimited spans, as re.sub(quote + '[^' + quote + ']*' + quote, '') would."""
+    if quote not in text:
+        return text
+    parts = text.split(quote)
+    if len(parts) % 2:
+        return ''.join(parts[::2])
+    # Odd number of quotes: the last one is unmatched and stays
+    return ''.join(parts[:-1:2]) + quote + parts[-1]
+
+
+@lru_cache(maxsize=4096)
+def _host_of(url: str) -> str:
+    """Lowercased network location of url (memoized: search URLs repeat)."""
+    return urlparse(url).netloc.lower()
+
+
 class QuerySanitizer:
     """Sanitizes queries to prevent data exfiltration."""
     
@@ -47,11 +78,48 @@ class QuerySanitizer:
         r'--\s*.*',  # Comments
     ]
     
+    # Compiled once; each keeps re's literal-prefix fast scan, which a single
+    # combined alternation would lose
+    _FORBIDDEN_COMPILED = tuple(
+        (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in FORBIDDEN_PATTERNS
+    )
+    
+    # Every forbidden pattern needs one of these literals ('from' matched
+    # case-insensitively) or, for the hash patterns, a 32+ character token
+    _FORBIDDEN_TRIGGERS = ('.', '/', '\\', '~', '--')
+    _HASH_MIN_LENGTH = 32
+    
     @staticmethod
+    def _may_be_forbidden(query: str) -> bool:
+        """Cheap exact prefilter: False means no forbidden pattern can match."""
+        if any(trigger in query for trigger in QuerySanitizer._FORBIDDEN_TRIGGERS):
+            return True
+        if 'from' in query.casefold():
+            return True
+        min_length = QuerySanitizer._HASH_MIN_LENGTH
+        return len(query) >= min_length and any(len(token) >= min_length for token in query.split())
+    
+    @staticmethod
+    def _find_forbidden(query: str) -> Optional[str]:
+        """Return the first forbidden pattern found in query, if any."""
+        # Typical keyword queries contain no trigger and skip every regex
+        if not QuerySanitizer._may_be_forbidden(query):
+            return None
+        for pattern, regex in QuerySanitizer._FORBIDDEN_COMPILED:
+            if regex.search(query):
+                return pattern
+        return None
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def sanitize(query: str) -> str:
         """
         Sanitize query for safe web retrieval.
         
+        Results are memoized per raw query (blocked queries are re-checked,
+        since exceptions are not cached); call sanitize.cache_clear() after
+        changing the class limits.
+        
         Removes:
         - File paths and extensions
         - Hash values
@@ -71,28 +139,24 @@ class QuerySanitizer:
         original_query = query
         
         # Check for forbidden patterns (BLOCK these)
-        for pattern in QuerySanitizer.FORBIDDEN_PATTERNS:
-            if re.search(pattern, query, re.IGNORECASE):
-                raise SecurityViolation(
-                    f"Query contains forbidden pattern: {pattern}. "
-                    f"Queries must contain only simple keywords, not internal content."
-                )
+        pattern = QuerySanitizer._find_forbidden(query)
+        if pattern is not None:
+            raise SecurityViolation(
+                f"Query contains forbidden pattern: {pattern}. "
+                f"Queries must contain only simple keywords, not internal content."
+            )
         
         # Remove quoted strings (e.g., "exact phrase")
-        sanitized = re.sub(r'"[^"]*"', '', query)
-        sanitized = re.sub(r"'[^']*'", '', sanitized)
+        sanitized = _drop_quoted(_drop_quoted(query, '"'), "'")
         
         # Remove special characters except spaces and hyphens
-        sanitized = re.sub(r'[^\w\s\-]', ' ', sanitized)
-        
-        # Collapse multiple spaces
-        sanitized = ' '.join(sanitized.split())
-        
-        # Convert to lowercase
-        sanitized = sanitized.lower()
+        if sanitized.isascii():
+            sanitized = sanitized.translate(_SPECIAL_CHARS_TABLE)
+        else:
+            sanitized = _SPECIAL_CHARS_RE.sub(' ', sanitized)
         
-        # Split into tokens and limit
-        tokens = sanitized.split()
+        # Lowercase, split into tokens (collapsing whitespace) and limit
+        tokens = sanitized.lower().split()
         if len(tokens) > QuerySanitizer.MAX_QUERY_LENGTH:
             tokens = tokens[:QuerySanitizer.MAX_QUERY_LENGTH]
         
@@ -110,13 +174,25 @@ class QuerySanitizer:
         return sanitized
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def is_safe(query: str) -> bool:
         """Check if query is safe without raising exception."""
-        try:
-            QuerySanitizer.sanitize(query)
-            return True
-        except SecurityViolation:
-            return False
+        # sanitize() only rejects forbidden patterns (it always leaves a keyword)
+        return QuerySanitizer._find_forbidden(query) is None
+    
+    @staticmethod
+    def filter_batch(queries: List[str]) -> List[str]:
+        """
+        Keep only the queries that are safe to sanitize and send.
+        
+        Args:
+            queries: Raw queries
+            
+        Returns:
+            Safe queries, in input order
+        """
+        is_safe = QuerySanitizer.is_safe
+        return [query for query in queries if is_safe(query)]
 
 
 class WebRetriever(BaseRetriever):
@@ -131,6 +207,9 @@ class WebRetriever(BaseRetriever):
     - Audit logging
     """
     
+    # Upper bound on concurrent per-domain fetches in retrieve()
+    MAX_FETCH_WORKERS = 8
+    
     def __init__(self, allowlist_domains: List[str],
                  cache_dir: str = "./cache/web",
                  audit_logger: Optional[AuditLogger] = None,
@@ -150,8 +229,17 @@ class WebRetriever(BaseRetriever):
         self.audit_logger = audit_logger
         self.timeout = timeout
         
-        # Session for connection pooling
+        # Session for connection pooling: keep one keep-alive pool per
+        # allowlisted host (requests caches only 10 by default, so larger
+        # allowlists would evict pools and redo TCP/TLS setup), each large
+        # enough for the concurrent fetches in retrieve()
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max(10, len(self.allowlist_domains)),
+            pool_maxsize=self.MAX_FETCH_WORKERS
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'RAG-Research-Assistant/1.0 (+http://example.com/bot)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
@@ -183,13 +271,23 @@ class WebRetriever(BaseRetriever):
         if security_context and security_context.mode == "offline":
             raise SecurityViolation("Web retrieval disabled in offline mode")
         
-        # Build search URLs for each domain
+        # Fetch from all domains concurrently (IO-bound), then collect in
+        # allowlist order so results match a sequential pass
+        domains = list(self.allowlist_domains)
+        if not domains:
+            return []
+        
         results = []
+        workers = min(self.MAX_FETCH_WORKERS, len(domains))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._retrieve_from_domain, domain, sanitized_query)
+                for domain in domains
+            ]
         
-        for domain in self.allowlist_domains:
+        for domain, future in zip(domains, futures):
             try:
-                retrieved = self._retrieve_from_domain(domain, sanitized_query)
-                results.extend(retrieved)
+                results.extend(future.result())
             except Exception as e:
                 if self.audit_logger:
                     self.audit_logger.log_error(
@@ -268,14 +366,25 @@ class WebRetriever(BaseRetriever):
             return f"https://{domain}/search?{urlencode({'q': query})}"
     
     def _validate_url(self, url: str) -> bool:
-        """Validate URL against allowlist."""
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
+        """
+        Validate URL against allowlist.
+        
+        The host matches if it, or any suffix following one of its dots, is
+        in the allowlist set, so the check costs one set lookup per label
+        rather than one endswith() per allowlisted domain.
+        """
+        domain = _host_of(url)
+        allowed = self.allowlist_domains
         
-        # Check if domain matches allowlist
-        for allowed_domain in self.allowlist_domains:
-            if domain == allowed_domain or domain.endswith('.' + allowed_domain):
+        if domain in allowed:
+            return True
+        
+        # Subdomains: a.b.example.org -> b.example.org, example.org, org
+        dot = domain.find('.')
+        while dot >= 0:
+            if domain[dot + 1:] in allowed:
                 return True
+            dot = domain.find('.', dot + 1)
         
         return False
     
@@ -313,10 +422,23 @@ class WebRetriever(BaseRetriever):
             'cache_key': cache_key
         }
         
-        # Save to cache
+        # Save to cache: write a uniquely named temp file, then atomically
+        # swap it in, so concurrent writers never contend and readers never
+        # see a partially written page. Mode 0o666 lets the umask apply, as
+        # it would for open().
         cache_file = self.cache_dir / f"{cache_key}.json"
-        with open(cache_file, 'w') as f:
-            json.dump(doc, f, indent=2)
+        tmp_path = self.cache_dir / f".{cache_key}.{uuid.uuid4().hex}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(json.dumps(doc, indent=2))
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
         
         return doc
     
@@ -8,9 +8,12 @@ Implements:
 - Self-test to verify security controls
 """
 
+import re
 import socket
 import threading
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlparse
 import hashlib
@@ -18,11 +21,53 @@ from datetime import datetime
 from pathlib import Path
 
 
+# Double- or single-quoted spans (suspected raw snippets), removed in one pass
+_QUOTED_RE = re.compile(r'"[^"]*"|\'[^\']*\'')
+
+# Anything other than ASCII alphanumerics and whitespace
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+
 class SecurityViolation(Exception):
     """Raised when security policy is violated."""
     pass
 
 
+# Real socket class, captured before any SecurityContext patches the module
+_REAL_SOCKET = socket.socket
+
+
+class _BlockedSocketMeta(type):
+    """Metaclass keeping isinstance/issubclass checks against the real socket."""
+    
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, _REAL_SOCKET)
+    
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, _REAL_SOCKET)
+
+
+class _BlockedSocket(_REAL_SOCKET, metaclass=_BlockedSocketMeta):
+    """Stand-in for socket.socket that refuses construction in offline mode."""
+    
+    def __new__(cls, *args, **kwargs):
+        raise SecurityViolation(
+            "Network socket creation blocked in offline mode. "
+            "Set security.mode=egress in config.yaml to enable network access."
+        )
+
+
+def _caused_by(exc: BaseException, exc_type: type) -> bool:
+    """Return True if exc or any exception in its cause/context chain is an exc_type."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, exc_type):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
 class SecurityContext:
     """
     Security context enforcing offline/egress modes.
@@ -56,27 +101,21 @@ class SecurityContext:
         
         # Thread-local storage to prevent socket creation in offline mode
         self._socket_creation_lock = threading.Lock()
-        self._original_socket = socket.socket
+        self._original_socket = getattr(socket, '_real_socket', socket.socket)
         
         if self.mode == "offline":
             self._patch_socket()
     
     def _patch_socket(self):
-        """Patch socket.socket to prevent network calls in offline mode."""
-        security_context = self
-        
-        def patched_socket(*args, **kwargs):
-            raise SecurityViolation(
-                "Network socket creation blocked in offline mode. "
-                "Set security.mode=egress in config.yaml to enable network access."
-            )
-        
-        # Replace socket constructor (warning: global patch)
-        socket.socket = patched_socket
+        """Swap socket.socket for a subclass that raises on construction."""
+        # Keep the real class reachable so a later context (or _unpatch_socket)
+        # never mistakes the blocked subclass for the original
+        socket._real_socket = self._original_socket
+        socket.socket = _BlockedSocket
     
     def _unpatch_socket(self):
         """Restore original socket (use with caution)."""
-        socket.socket = self._original_socket
+        socket.socket = getattr(socket, '_real_socket', self._original_socket)
     
     def validate_url(self, url: str) -> bool:
         """
@@ -123,13 +162,10 @@ class SecurityContext:
             return query
         
         # Remove quoted strings (suspected raw snippets)
-        sanitized = query
-        import re
-        sanitized = re.sub(r'"[^"]*"', '', sanitized)
-        sanitized = re.sub(r"'[^']*'", '', sanitized)
+        sanitized = _QUOTED_RE.sub('', query)
         
         # Keep only alphanumeric and spaces
-        sanitized = re.sub(r'[^a-zA-Z0-9\s]', ' ', sanitized)
+        sanitized = _NON_ALNUM_RE.sub(' ', sanitized)
         sanitized = ' '.join(sanitized.split())  # Collapse whitespace
         
         # Truncate
@@ -192,6 +228,9 @@ class SecuritySelfTest:
     Attempts prohibited actions and verifies they are blocked.
     """
     
+    # Seconds run_all_tests waits for the checks before failing the rest
+    TEST_TIMEOUT = 10.0
+    
     def __init__(self, security_context: SecurityContext):
         """
         Initialize self-test.
@@ -225,13 +264,25 @@ class SecuritySelfTest:
         
         try:
             import requests
-            resp = requests.get("https://example.com")
+        except ImportError:
+            self.results.append(("test_offline_http_blocked", "SKIPPED", "requests not installed"))
+            return True
+        
+        try:
+            resp = requests.get("https://example.com", timeout=self.TEST_TIMEOUT)
             self.results.append(("test_offline_http_blocked", "FAILED", "HTTP request succeeded (should be blocked)"))
             return False
-        except (SecurityViolation, Exception) as e:
-            # Either our security patch or requests library error
+        except SecurityViolation as e:
             self.results.append(("test_offline_http_blocked", "PASSED", f"Request blocked: {type(e).__name__}"))
             return True
+        except requests.RequestException as e:
+            # A failed name lookup happens before any socket is requested, so it
+            # only proves nothing left the host while sockets are still blocked
+            if socket.socket is _BlockedSocket and _caused_by(e, socket.gaierror):
+                self.results.append(("test_offline_http_blocked", "PASSED", f"Name lookup failed with sockets blocked: {type(e).__name__}"))
+                return True
+            self.results.append(("test_offline_http_blocked", "FAILED", f"Request failed without being blocked: {type(e).__name__}"))
+            return False
     
     def test_egress_allowlist_enforced(self) -> bool:
         """Test that disallowed domains are rejected in egress mode."""
@@ -311,6 +362,10 @@ class SecuritySelfTest:
         """
         Run all security self-tests.
         
+        The checks are independent and read-only, so they run concurrently.
+        Checks still running after TEST_TIMEOUT seconds (e.g. the HTTP attempt
+        stuck in a blocking name lookup) are recorded as FAILED and abandoned.
+        
         Returns:
             True if all tests passed, False otherwise
         """
@@ -325,10 +380,26 @@ class SecuritySelfTest:
             self.test_query_length_limit,
         ]
         
-        passed = sum(1 for test in tests if test())
-        total = len(tests)
-        
-        return passed == total
+        executor = ThreadPoolExecutor(max_workers=4)
+        futures = [executor.submit(test) for test in tests]
+        deadline = time.monotonic() + self.TEST_TIMEOUT
+        outcomes = []
+        try:
+            for test, future in zip(tests, futures):
+                try:
+                    outcomes.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except FuturesTimeoutError:
+                    self.results.append((test.__name__, "FAILED", f"Timed out after {self.TEST_TIMEOUT:g}s"))
+                    outcomes.append(False)
+        finally:
+            # Don't wait on a check stuck in a call that cannot be interrupted
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Threads append in completion order; report in declaration order
+        order = {test.__name__: i for i, test in enumerate(tests)}
+        self.results.sort(key=lambda result: order.get(result[0], len(order)))
+        
+        return all(outcomes)
     
     def print_results(self):
         """Print formatted test results."""
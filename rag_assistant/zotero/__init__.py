@@ -8,14 +8,16 @@ Supports:
 - Bibliography generation (BibTeX and formatted)
 """
 
-from .parser import parse_zotero_export, ZoteroItem
+from .parser import parse_zotero_export, parse_zotero_exports, ZoteroItem
 from .index import CitationIndex
-from .formatter import BibTeXFormatter, FormattedCitationFormatter
+from .formatter import BibTeXFormatter, FormattedCitationFormatter, items_to_bibtex
 
 __all__ = [
     'parse_zotero_export',
+    'parse_zotero_exports',
     'ZoteroItem',
     'CitationIndex',
     'BibTeXFormatter',
     'FormattedCitationFormatter',
+    'items_to_bibtex',
 ]
\ No newline at end of file
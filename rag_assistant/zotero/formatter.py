@@ -6,38 +6,58 @@ Generates:
 - Formatted citation lists (for Word and text)
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from .parser import ZoteroItem
 from .index import CitationIndex
 
 
+_BIBTEX_HEADER = (
+    "% Generated by RAG Research Assistant\n"
+    "% Zotero Bibliography Export\n"
+)
+
+
+def items_to_bibtex(items: Iterable[ZoteroItem]) -> str:
+    """
+    Render BibTeX entries for many items in a single join.
+    
+    Args:
+        items: ZoteroItem objects to render
+        
+    Returns:
+        Entries separated by blank lines, with a trailing newline
+        (empty string if there are no items)
+    """
+    entries = [item.to_bibtex() for item in items]
+    if not entries:
+        return ''
+    return '\n\n'.join(entries) + '\n'
+
+
 class BibTeXFormatter:
     """Generate BibTeX bibliography files."""
     
     @staticmethod
-    def generate(items: List[ZoteroItem], include_header: bool = True) -> str:
+    def generate(items: Iterable[ZoteroItem], include_header: bool = True) -> str:
         """
         Generate complete BibTeX file content.
         
+        Entries are rendered into one list and joined once, so output size
+        stays linear in the number of items (no repeated concatenation).
+        
         Args:
-            items: List of ZoteroItem objects
+            items: ZoteroItem objects (any iterable, consumed once)
             include_header: Include standard BibTeX header comment
             
         Returns:
             BibTeX file content
         """
-        lines = []
+        body = items_to_bibtex(items)
         
-        if include_header:
-            lines.append("% Generated by RAG Research Assistant")
-            lines.append("% Zotero Bibliography Export")
-            lines.append("")
-        
-        for item in items:
-            lines.append(item.to_bibtex())
-            lines.append("")
+        if not include_header:
+            return body
         
-        return '\n'.join(lines)
+        return _BIBTEX_HEADER + ('\n' + body if body else '')
     
     @staticmethod
     def generate_from_citekeys(index: CitationIndex, citekeys: List[str]) -> str:
@@ -51,11 +71,8 @@ class BibTeXFormatter:
         Returns:
             BibTeX content
         """
-        items = []
-        for citekey in citekeys:
-            item = index.get(citekey)
-            if item:
-                items.append(item)
+        get = index.get
+        items = (item for item in map(get, citekeys) if item)
         
         return BibTeXFormatter.generate(items)
 
@@ -180,19 +197,13 @@ class FormattedCitationFormatter:
         Returns:
             HTML list string
         """
-        lines = ['<ol>']
-        
-        for i, item in enumerate(items, start=start_index):
-            authors = BibTeXHelpers._format_authors_short(item.authors)
-            title = item.title or "Unknown"
-            year = item.year or 'n.d.'
-            
-            citation = f"{authors}, \"{title},\" {year}."
-            lines.append(f"  <li>{citation}</li>")
-        
-        lines.append('</ol>')
+        short = BibTeXHelpers._format_authors_short
+        lines = [
+            f'  <li>{short(item.authors)}, "{item.title or "Unknown"}," {item.year or "n.d."}.</li>'
+            for item in items
+        ]
         
-        return '\n'.join(lines)
+        return '\n'.join(['<ol>', *lines, '</ol>'])
     
     @staticmethod
     def format_markdown_list(items: List[ZoteroItem]) -> str:
@@ -205,15 +216,11 @@ class FormattedCitationFormatter:
         Returns:
             Markdown list string
         """
-        lines = []
-        
-        for i, item in enumerate(items, 1):
-            authors = BibTeXHelpers._format_authors_short(item.authors)
-            title = item.title or "Unknown"
-            year = item.year or 'n.d.'
-            
-            citation = f"{authors}, \"{title},\" {year}."
-            lines.append(f"{i}. {citation}")
+        short = BibTeXHelpers._format_authors_short
+        lines = [
+            f'{i}. {short(item.authors)}, "{item.title or "Unknown"}," {item.year or "n.d."}.'
+            for i, item in enumerate(items, 1)
+        ]
         
         return '\n'.join(lines)
 
@@ -4,12 +4,120 @@ Citation index for fast lookups by citekey, DOI, or title.
 Maintains multiple indexes for efficient search.
 """
 
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Iterator, Sized
 from collections import defaultdict
 import re
+import sys
+import numpy as np
 from .parser import ZoteroItem
 
 
+# Punctuation dropped by CitationIndex._normalize
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+class _TrigramIndex:
+    """
+    Trigram postings over one index's keys, for substring lookups.
+    
+    A key contains the query only if it has every query trigram, so those
+    candidates come from intersecting posting sets. A key is contained in
+    the query only if all of its trigrams occur there; each key is filed
+    under one "anchor" trigram (the rarest when added), so those candidates
+    are the keys anchored at a query trigram. Keys shorter than a trigram
+    are always checked. Candidates are verified with ``in`` and yielded in
+    insertion order, so callers see the same keys a full scan would.
+    
+    When even the rarest query trigram is common, a plain scan (which the
+    caller can stop early) is cheaper than building the candidate set.
+    """
+    
+    __slots__ = ('keys', 'postings', 'anchors', 'short_ids')
+    
+    # Scan instead when the rarest query trigram is in more than 1/DENSE of keys
+    DENSE = 8
+    
+    def __init__(self):
+        self.keys: List[str] = []
+        self.postings: Dict[str, Set[int]] = {}
+        self.anchors: Dict[str, List[int]] = {}
+        self.short_ids: List[int] = []
+    
+    def add(self, key: str):
+        """Record a newly indexed key."""
+        key_id = len(self.keys)
+        self.keys.append(key)
+        trigrams = {key[i:i + 3] for i in range(len(key) - 2)}
+        if not trigrams:
+            self.short_ids.append(key_id)
+            return
+        postings = self.postings
+        # Track the rarest trigram while inserting, rather than a second
+        # min() pass over the postings
+        anchor = None
+        anchor_size = len(self.keys) + 1
+        for trigram in trigrams:
+            posting = postings.get(trigram)
+            if posting is None:
+                postings[trigram] = {key_id}
+                size = 1
+            else:
+                posting.add(key_id)
+                size = len(posting)
+            if size < anchor_size:
+                anchor = trigram
+                anchor_size = size
+        self.anchors.setdefault(anchor, []).append(key_id)
+    
+    def _query_postings(self, trigrams: Set[str]) -> Optional[List[Set[int]]]:
+        """Posting sets for the query trigrams, rarest first (None if one is absent)."""
+        postings = self.postings
+        sets = []
+        for trigram in trigrams:
+            posting = postings.get(trigram)
+            if posting is None:
+                return None
+            sets.append(posting)
+        sets.sort(key=len)
+        return sets
+    
+    def containing(self, query: str) -> Iterator[str]:
+        """Keys that contain query, in insertion order."""
+        keys = self.keys
+        trigrams = {query[i:i + 3] for i in range(len(query) - 2)}
+        if not trigrams:
+            return (key for key in keys if query in key)
+        sets = self._query_postings(trigrams)
+        if sets is None:
+            return iter(())
+        if len(sets[0]) * self.DENSE > len(keys):
+            return (key for key in keys if query in key)
+        ids = sets[0].intersection(*sets[1:])
+        return (keys[i] for i in sorted(ids) if query in keys[i])
+    
+    def matching(self, query: str) -> Iterator[str]:
+        """Keys that contain, or are contained in, query, in insertion order."""
+        keys = self.keys
+        trigrams = {query[i:i + 3] for i in range(len(query) - 2)}
+        if not trigrams:
+            return (key for key in keys if query in key or key in query)
+        
+        sets = self._query_postings(trigrams)
+        if sets is not None and len(sets[0]) * self.DENSE > len(keys):
+            return (key for key in keys if query in key or key in query)
+        
+        ids = set(self.short_ids)
+        anchors = self.anchors
+        for trigram in trigrams:
+            anchored = anchors.get(trigram)
+            if anchored:
+                ids.update(anchored)
+        if sets is not None:
+            ids |= sets[0].intersection(*sets[1:])
+        
+        return (keys[i] for i in sorted(ids) if query in keys[i] or keys[i] in query)
+
+
 class CitationIndex:
     """
     Index for Zotero items enabling fast lookup by multiple keys.
@@ -30,6 +138,17 @@ class CitationIndex:
         self.by_author: Dict[str, List[str]] = defaultdict(list)  # author -> [citekeys]
         self.by_tag: Dict[str, List[str]] = defaultdict(list)  # tag -> [citekeys]
         self.all_citekeys: Set[str] = set()
+        self._title_trigrams = _TrigramIndex()
+        self._author_trigrams = _TrigramIndex()
+        self._tag_trigrams = _TrigramIndex()
+        
+        # Columnar copies of the numeric/categorical fields, one row per
+        # citekey in insertion order, so search_advanced filters by mask
+        self._rows: Dict[str, int] = {}  # citekey -> row
+        self._row_citekeys: List[str] = []  # row -> citekey
+        self._years = np.full(64, -1, dtype=np.int16)  # -1: no (integer) year
+        self._type_codes = np.full(64, -1, dtype=np.int16)
+        self._type_code_map: Dict[str, int] = {}  # item_type -> code
     
     def add_item(self, item: ZoteroItem):
         """
@@ -38,41 +157,94 @@ class CitationIndex:
         Args:
             item: ZoteroItem to index
         """
-        if not item.citekey:
-            raise ValueError("Item must have citekey")
-        
-        citekey = item.citekey
-        self.items[citekey] = item
-        self.all_citekeys.add(citekey)
-        
-        # Index by DOI
-        if item.doi:
-            self.by_doi[item.doi.lower()] = citekey
-        
-        # Index by title (normalized)
-        if item.title:
-            normalized_title = self._normalize(item.title)
-            self.by_title[normalized_title].append(citekey)
-        
-        # Index by authors
-        for author in item.authors:
-            normalized_author = self._normalize(author)
-            self.by_author[normalized_author].append(citekey)
-        
-        # Index by tags
-        for tag in item.tags:
-            normalized_tag = self._normalize(tag)
-            self.by_tag[normalized_tag].append(citekey)
+        self.add_items((item,))
     
     def add_items(self, items: List[ZoteroItem]):
         """
         Add multiple items to index.
         
+        Index dicts and the normalizer are bound to locals once for the
+        whole batch rather than re-resolved per item and per author/tag,
+        and the columnar arrays are grown once for the batch.
+        
         Args:
             items: List of ZoteroItem objects
         """
+        normalize = self._normalize
+        by_item = self.items
+        by_doi = self.by_doi
+        by_title = self.by_title
+        by_author = self.by_author
+        by_tag = self.by_tag
+        add_citekey = self.all_citekeys.add
+        title_trigrams = self._title_trigrams
+        author_trigrams = self._author_trigrams
+        tag_trigrams = self._tag_trigrams
+        rows = self._rows
+        row_citekeys = self._row_citekeys
+        type_code_map = self._type_code_map
+        
+        # Size the columns for the whole batch at once
+        if isinstance(items, Sized):
+            self._reserve_rows(len(row_citekeys) + len(items))
+        
         for item in items:
-            self.add_item(item)
+            citekey = item.citekey
+            if not citekey:
+                raise ValueError("Item must have citekey")
+            
+            by_item[citekey] = item
+            add_citekey(citekey)
+            
+            # Columnar year / item type
+            row = rows.get(citekey)
+            if row is None:
+                row = rows[citekey] = len(row_citekeys)
+                row_citekeys.append(citekey)
+                if row == len(self._years):
+                    self._reserve_rows(row + 1)
+            year = item.year
+            self._years[row] = year if type(year) is int and 0 < year <= 32767 else -1
+            type_code = type_code_map.get(item.item_type)
+            if type_code is None:
+                type_code = type_code_map[item.item_type] = len(type_code_map)
+            self._type_codes[row] = type_code
+            
+            # Index by DOI
+            if item.doi:
+                by_doi[item.doi.lower()] = citekey
+            
+            # Index by title (normalized)
+            if item.title:
+                key = normalize(item.title)
+                if key not in by_title:
+                    title_trigrams.add(key)
+                by_title[key].append(citekey)
+            
+            # Index by authors
+            for author in item.authors:
+                key = normalize(author)
+                if key not in by_author:
+                    author_trigrams.add(key)
+                by_author[key].append(citekey)
+            
+            # Index by tags
+            for tag in item.tags:
+                key = normalize(tag)
+                if key not in by_tag:
+                    tag_trigrams.add(key)
+                by_tag[key].append(citekey)
+    
+    def _reserve_rows(self, count: int):
+        """Grow the columnar arrays (at least doubling) to hold count rows."""
+        size = len(self._years)
+        if count <= size:
+            return
+        capacity = max(size * 2, count)
+        for name in ('_years', '_type_codes'):
+            column = np.full(capacity, -1, dtype=np.int16)
+            column[:size] = getattr(self, name)
+            setattr(self, name, column)
     
     def get(self, citekey: str) -> Optional[ZoteroItem]:
         """
@@ -112,34 +284,31 @@ class CitationIndex:
             result_citekeys.add(citekey)
         
         # Title matches
-        for title_norm, citekeys in self.by_title.items():
-            if normalized_query in title_norm or title_norm in normalized_query:
-                for citekey in citekeys:
-                    if citekey not in result_citekeys:
-                        results.append(self.items[citekey])
-                        result_citekeys.add(citekey)
-                        if len(results) >= limit:
-                            return results
+        for title_norm in self._title_trigrams.matching(normalized_query):
+            for citekey in self.by_title[title_norm]:
+                if citekey not in result_citekeys:
+                    results.append(self.items[citekey])
+                    result_citekeys.add(citekey)
+                    if len(results) >= limit:
+                        return results
         
         # Author matches
-        for author_norm, citekeys in self.by_author.items():
-            if normalized_query in author_norm or author_norm in normalized_query:
-                for citekey in citekeys:
-                    if citekey not in result_citekeys:
-                        results.append(self.items[citekey])
-                        result_citekeys.add(citekey)
-                        if len(results) >= limit:
-                            return results
+        for author_norm in self._author_trigrams.matching(normalized_query):
+            for citekey in self.by_author[author_norm]:
+                if citekey not in result_citekeys:
+                    results.append(self.items[citekey])
+                    result_citekeys.add(citekey)
+                    if len(results) >= limit:
+                        return results
         
         # Tag matches
-        for tag_norm, citekeys in self.by_tag.items():
-            if normalized_query in tag_norm or tag_norm in normalized_query:
-                for citekey in citekeys:
-                    if citekey not in result_citekeys:
-                        results.append(self.items[citekey])
-                        result_citekeys.add(citekey)
-                        if len(results) >= limit:
-                            return results
+        for tag_norm in self._tag_trigrams.matching(normalized_query):
+            for citekey in self.by_tag[tag_norm]:
+                if citekey not in result_citekeys:
+                    results.append(self.items[citekey])
+                    result_citekeys.add(citekey)
+                    if len(results) >= limit:
+                        return results
         
         return results[:limit]
     
@@ -147,61 +316,84 @@ class CitationIndex:
                        doi: Optional[str] = None,
                        author: Optional[str] = None,
                        year: Optional[int] = None,
-                       title: Optional[str] = None) -> List[ZoteroItem]:
+                       title: Optional[str] = None,
+                       item_type: Optional[str] = None) -> List[ZoteroItem]:
         """
         Advanced search with multiple criteria (AND logic).
         
+        Criteria are combined as a boolean mask over the index rows; year and
+        item type compare whole NumPy columns at once.
+        
         Args:
             citekey: Exact citekey match
             doi: Exact DOI match
             author: Author name substring
             year: Exact year match
             title: Title substring
+            item_type: Exact item type match (e.g. 'article')
             
         Returns:
-            List of matching items
+            List of matching items, in insertion order
         """
-        results = set(self.items.keys())
+        # The year column stores -1 for rows without an in-range integer year
+        if year and not (type(year) is int and 0 < year <= 32767):
+            return []
+        
+        n = len(self._row_citekeys)
+        mask = np.ones(n, dtype=bool)
         
         if citekey:
-            results &= {citekey} if citekey in self.items else set()
+            mask &= self._row_mask((citekey,))
         
         if doi:
-            citekey = self.by_doi.get(doi.lower())
-            results &= {citekey} if citekey else set()
+            doi_citekey = self.by_doi.get(doi.lower())
+            mask &= self._row_mask((doi_citekey,) if doi_citekey else ())
         
         if author:
             author_norm = self._normalize(author)
             matching_citekeys = set()
-            for author_norm_idx, citekeys in self.by_author.items():
-                if author_norm in author_norm_idx:
-                    matching_citekeys.update(citekeys)
-            results &= matching_citekeys if matching_citekeys else set()
+            for author_norm_idx in self._author_trigrams.containing(author_norm):
+                matching_citekeys.update(self.by_author[author_norm_idx])
+            mask &= self._row_mask(matching_citekeys)
         
         if year:
-            year_citekeys = {
-                ck for ck, item in self.items.items()
-                if item.year == year
-            }
-            results &= year_citekeys
+            mask &= self._years[:n] == year
+        
+        if item_type:
+            type_code = self._type_code_map.get(item_type)
+            if type_code is None:
+                mask[:] = False
+            else:
+                mask &= self._type_codes[:n] == type_code
         
         if title:
             title_norm = self._normalize(title)
             title_citekeys = set()
-            for title_norm_idx, citekeys in self.by_title.items():
-                if title_norm in title_norm_idx:
-                    title_citekeys.update(citekeys)
-            results &= title_citekeys if title_citekeys else set()
+            for title_norm_idx in self._title_trigrams.containing(title_norm):
+                title_citekeys.update(self.by_title[title_norm_idx])
+            mask &= self._row_mask(title_citekeys)
         
-        return [self.items[ck] for ck in results if ck in self.items]
+        items = self.items
+        row_citekeys = self._row_citekeys
+        return [items[row_citekeys[row]] for row in np.flatnonzero(mask)]
+    
+    def _row_mask(self, citekeys) -> np.ndarray:
+        """Boolean mask selecting the rows of the given citekeys."""
+        mask = np.zeros(len(self._row_citekeys), dtype=bool)
+        rows = self._rows
+        mask[[rows[ck] for ck in citekeys if ck in rows]] = True
+        return mask
     
     @staticmethod
     def _normalize(text: str) -> str:
-        """Normalize text for comparison (lowercase, no special chars)."""
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', '', text)
-        text = ' '.join(text.split())
-        return text
+        """
+        Normalize text for comparison (lowercase, no special chars).
+        
+        Results are interned: authors and tags repeat across a library, so
+        every index key for the same name shares one string object.
+        """
+        text = _PUNCT_RE.sub('', text.lower())
+        return sys.intern(' '.join(text.split()))
     
     def get_all(self) -> List[ZoteroItem]:
         """Get all indexed items."""
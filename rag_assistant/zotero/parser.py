@@ -4,14 +4,173 @@ Parse Zotero export formats: Better BibTeX JSON and BibTeX (.bib).
 Prefers Better BibTeX JSON if both are present.
 """
 
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator, BinaryIO
 import json
+import logging
+import mmap
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, InitVar
+
+try:
+    import orjson  # Optional: C JSON parser, 2-5x faster on large exports
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: incremental parser (picks its yajl2_c backend when built)
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Start of a BibTeX "@type{" entry; entries run up to the next one or end of input
+_ENTRY_START_RE = re.compile(r'@\w+\s*\{')
+
+# Entry header "@type{citekey," and the whitespace before its first field
+_ENTRY_HEAD_RE = re.compile(r'@(\w+)\s*{\s*([^,]+?)\s*,\s*', re.IGNORECASE)
+
+# BibTeX commands that share the "@type{" syntax but are not references
+_NON_ENTRY_TYPES = frozenset({'comment', 'string', 'preamble'})
+
+# Separators followed by the "key =" that opens a BibTeX field
+_FIELD_KEY_RE = re.compile(r'[\s,]*([\w\-:.]+)\s*=\s*')
+
+# Separators only (used to resync after malformed input)
+_FIELD_SEP_RE = re.compile(r'[\s,]*')
+
+# Structural characters inside braced, quoted and bare field values
+_BRACE_RE = re.compile(r'[{}]')
+_QUOTED_VALUE_RE = re.compile(r'[{}"]')
+_BARE_VALUE_END_RE = re.compile(r'[,}]')
+
+# One name in a BibTeX author list: words, {protected groups} and inner
+# whitespace, up to the next " and " separator
+_AUTHOR_RE = re.compile(r'(?:^|\s+and\s+)((?:[^{}\s]+|\{[^{}]*\}|[{}]|\s+(?!and\s)(?=\S))+)')
+
+# Four-digit 19xx/20xx year (anywhere in a BibTeX field, or as a whole word in
+# a free-form CSL date string)
+_YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+_WORD_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Export format implied by a file extension
+_FORMAT_BY_SUFFIX = {'.json': 'json', '.bib': 'bibtex'}
+
+
+def _parse_year(text: str, pattern: re.Pattern = _YEAR_RE) -> Optional[int]:
+    """
+    Extract a 19xx/20xx year from a date-like field.
+    
+    A leading year ("2023", "2023-05-01", nearly every BibTeX year field
+    and CSL date string) is recognised with string checks alone; anything
+    else falls back to searching with pattern.
+    """
+    if len(text) >= 4 and text[:2] in ('19', '20') and text[2:4].isdecimal():
+        after = text[4:5]
+        if not (after.isalnum() or after == '_'):
+            return int(text[:4])
+    year_match = pattern.search(text)
+    return int(year_match.group(0)) if year_match else None
+
+
+def _strip_braces(value: str) -> str:
+    """
+    Remove brace groups that enclose the whole value.
+    
+    {{Deep Learning}} becomes Deep Learning, while {CNN} and {RNN} is left
+    alone because its first group closes before the end.
+    """
+    while value[:1] == '{' and value[-1:] == '}':
+        depth = 0
+        for match in _BRACE_RE.finditer(value):
+            depth += 1 if match.group() == '{' else -1
+            if depth == 0:
+                break
+        if match.end() != len(value):
+            break
+        value = value[1:-1]
+    return value
+
 
+def _iter_entries(content: str) -> Iterator[Tuple[re.Match, int]]:
+    """
+    Yield (header match, end offset) for each "@type{citekey," entry.
+    
+    Entry boundaries come from a single linear scan for "@type{", so there
+    is no lazy body match re-testing a lookahead at every character.
+    @comment, @string and @preamble blocks are skipped rather than parsed
+    as references.
+    """
+    bounds = [match.start() for match in _ENTRY_START_RE.finditer(content)]
+    bounds.append(len(content))
+    for start, end in zip(bounds, bounds[1:]):
+        head = _ENTRY_HEAD_RE.match(content, start, end)
+        if head and head.group(1).lower() not in _NON_ENTRY_TYPES:
+            yield head, end
+
+
+def _ext(fields: Dict[str, str], key: str) -> Optional[str]:
+    """Return a BibTeX field with enclosing braces removed, or None if absent or empty."""
+    value = fields.get(key)
+    if not value:
+        return None
+    if value[0] == '{' and value[-1] == '}':
+        return _strip_braces(value)
+    return value
+
+
+def _read_utf8(path: Path) -> str:
+    """
+    Read a UTF-8 text file, decoding straight from a memory map.
+    
+    Unlike read_bytes().decode(), no bytes copy of the whole file is made
+    first, so a large .bib only costs its decoded str in memory. Line
+    endings are normalized to '\n' as read_text() would.
+    """
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, 'utf-8')
+        except (ValueError, OSError):
+            # Empty files (and some special files) cannot be mapped
+            text = f.read().decode('utf-8')
+    
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or UTF-8 bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-@dataclass
+
+def _peek_first_byte(fp: BinaryIO) -> bytes:
+    """Return the first non-whitespace byte of fp without consuming it."""
+    start = fp.tell()
+    first = b''
+    while True:
+        chunk = fp.read(64)
+        if not chunk:
+            break
+        chunk = chunk.lstrip()
+        if chunk:
+            first = chunk[:1]
+            break
+    fp.seek(start)
+    return first
+
+
+@dataclass(slots=True)
 class ZoteroItem:
     """Represents a single bibliographic item."""
     
@@ -23,7 +182,7 @@ class ZoteroItem:
     
     # Bibliographic data
     title: str = ""
-    authors: List[str] = None  # List of author names
+    authors: List[str] = field(default_factory=list)  # List of author names
     year: Optional[int] = None
     item_type: str = ""  # article, book, inproceedings, etc.
     
@@ -37,17 +196,20 @@ class ZoteroItem:
     issue: Optional[str] = None
     pages: Optional[str] = None
     abstract: Optional[str] = None
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     
-    # Raw BibTeX entry (if available)
-    raw_bibtex: Optional[str] = None
+    # Raw BibTeX entry (if available); read through the raw_bibtex property.
+    # Parsed .bib entries keep the shared file text plus their (start, end)
+    # span rather than a copy of the entry, so the whole file stays in memory
+    # while any of its items is alive. Assign raw_bibtex (or use
+    # dataclasses.replace) to hold a standalone copy instead.
+    raw_bibtex: InitVar[Optional[str]] = None
+    _raw_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _raw_span: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
     
-    def __post_init__(self):
-        """Initialize default values."""
-        if self.authors is None:
-            self.authors = []
-        if self.tags is None:
-            self.tags = []
+    def __post_init__(self, raw_bibtex: Optional[str]):
+        """Store an explicitly given raw entry as the whole source."""
+        self._raw_source = raw_bibtex
     
     def to_bibtex(self) -> str:
         """
@@ -56,8 +218,9 @@ class ZoteroItem:
         Returns:
             BibTeX entry string
         """
-        if self.raw_bibtex:
-            return self.raw_bibtex
+        raw = self.raw_bibtex
+        if raw:
+            return raw
         
         lines = [f"@{self.item_type}{{{self.citekey},"]
         
@@ -114,6 +277,24 @@ class ZoteroItem:
         return f"{first_author}{et_al} ({self.year or 'n.d.'})"
 
 
+def _get_raw_bibtex(self: ZoteroItem) -> Optional[str]:
+    """Raw BibTeX entry text, sliced from the source on demand."""
+    if self._raw_span is None:
+        return self._raw_source
+    start, end = self._raw_span
+    return self._raw_source[start:end]
+
+
+def _set_raw_bibtex(self: ZoteroItem, value: Optional[str]) -> None:
+    self._raw_source = value
+    self._raw_span = None
+
+
+# Assigned after the dataclass is built so that raw_bibtex stays an __init__
+# argument (InitVar) while reads go through the lazy slice
+ZoteroItem.raw_bibtex = property(_get_raw_bibtex, _set_raw_bibtex)
+
+
 class BetterBibTeXParser:
     """Parse Better BibTeX JSON export format."""
 
@@ -127,12 +308,20 @@ class BetterBibTeXParser:
     }
     
     @staticmethod
-    def parse(json_data: Union[str, dict]) -> List[ZoteroItem]:
+    @lru_cache(maxsize=64)
+    def _map_type(raw: str) -> str:
+        """Map a raw item type to its BibTeX type (memoized and interned)."""
+        raw = raw.lower()
+        return sys.intern(BetterBibTeXParser._ITEM_TYPE_MAP.get(raw, raw))
+    
+    @staticmethod
+    def parse(json_data: Union[str, bytes, dict, BinaryIO]) -> List[ZoteroItem]:
         """
         Parse Better BibTeX JSON export.
         
         Args:
-            json_data: JSON string or dict
+            json_data: JSON string, UTF-8 bytes, already-decoded dict/list,
+                or a binary file object (streamed via iter_parse)
             
         Returns:
             List of ZoteroItem objects
@@ -140,16 +329,17 @@ class BetterBibTeXParser:
         Raises:
             ValueError: If JSON invalid
         """
-        if isinstance(json_data, str):
+        if hasattr(json_data, 'read'):
+            return list(BetterBibTeXParser.iter_parse(json_data))
+        
+        if isinstance(json_data, (str, bytes, bytearray)):
             try:
-                data = json.loads(json_data)
+                data = _json_loads(json_data)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON: {e}")
         else:
             data = json_data
         
-        items = []
-        
         # Handle list of items
         if isinstance(data, list):
             items_list = data
@@ -158,72 +348,126 @@ class BetterBibTeXParser:
         else:
             raise ValueError("Expected list of items or dict with 'items' key")
         
+        return list(BetterBibTeXParser._iter_items(items_list))
+    
+    @staticmethod
+    def iter_parse(fp: BinaryIO) -> Iterator[ZoteroItem]:
+        """
+        Stream items from a Better BibTeX JSON export file.
+        
+        With ijson installed, items are decoded one at a time, so peak memory
+        no longer grows with library size and the first items are available
+        immediately. Without it the whole document is decoded up front.
+        
+        Args:
+            fp: Seekable binary file object holding the export
+            
+        Yields:
+            ZoteroItem objects
+            
+        Raises:
+            ValueError: If JSON invalid
+        """
+        if ijson is None:
+            yield from BetterBibTeXParser.parse(fp.read())
+            return
+        
+        start = fp.tell()
+        first = _peek_first_byte(fp)
+        if first == b'[':
+            prefix = 'item'
+        elif first == b'{':
+            prefix = 'items.item'
+        else:
+            raise ValueError("Expected list of items or dict with 'items' key")
+        
+        try:
+            found = False
+            for item in BetterBibTeXParser._iter_items(
+                ijson.items(fp, prefix, use_float=True)
+            ):
+                found = True
+                yield item
+            
+            # An object without an 'items' key yields nothing; tell that
+            # apart from an empty export with a second (cheap) pass
+            if not found and first == b'{':
+                fp.seek(start)
+                if not any(
+                    event == 'map_key' and value == 'items'
+                    for path, event, value in ijson.parse(fp)
+                    if path == ''
+                ):
+                    raise ValueError("Expected list of items or dict with 'items' key")
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+    
+    @staticmethod
+    def _iter_items(items_list: Iterable[dict]) -> Iterator[ZoteroItem]:
+        """Parse raw item dicts, skipping (and reporting) malformed ones."""
+        errors = Counter()
         for item_data in items_list:
             try:
-                item = BetterBibTeXParser._parse_item(item_data)
-                items.append(item)
+                yield BetterBibTeXParser._parse_item(item_data)
             except Exception as e:
-                print(f"Warning: Failed to parse item {item_data.get('key', 'unknown')}: {e}")
+                key = item_data.get('key', 'unknown') if isinstance(item_data, dict) else 'unknown'
+                logger.debug("Failed to parse item %s: %s", key, e)
+                errors[type(e).__name__] += 1
         
-        return items
+        if errors:
+            logger.warning("Failed to parse %d item(s): %s", sum(errors.values()), errors.most_common(5))
     
     @staticmethod
     def _parse_item(item_data: dict) -> ZoteroItem:
         """Parse single Better BibTeX item."""
+        get = item_data.get
+        
         # Extract citekey (Better BibTeX uses 'citationKey')
-        citekey = (
-            item_data.get('citationKey') or
-            item_data.get('key') or
-            item_data.get('id', 'unknown')
-        )
+        citekey = get('citationKey') or get('key') or get('id', 'unknown')
         
         # Parse authors
         authors = []
-        if 'creators' in item_data:
-            for creator in item_data['creators']:
-                if isinstance(creator, dict):
-                    name_parts = []
-                    if creator.get('given'):
-                        name_parts.append(creator['given'])
-                    if creator.get('family'):
-                        name_parts.append(creator['family'])
-                    if name_parts:
-                        authors.append(' '.join(name_parts))
-                elif isinstance(creator, str):
-                    authors.append(creator)
+        append_author = authors.append
+        for creator in get('creators', ()):
+            if isinstance(creator, dict):
+                given = creator.get('given')
+                family = creator.get('family')
+                if given and family:
+                    append_author(' '.join((given, family)))
+                elif given or family:
+                    append_author(given or family)
+            elif isinstance(creator, str):
+                append_author(creator)
         
         # Parse year
         year = None
-        if 'issued' in item_data:
-            issued = item_data['issued']
-            if isinstance(issued, dict) and 'date-parts' in issued:
-                year_parts = issued['date-parts'][0] if issued['date-parts'] else None
-                year = year_parts[0] if year_parts else None
-            elif isinstance(issued, str):
-                year_match = re.search(r'\b(20\d{2}|19\d{2})\b', issued)
-                year = int(year_match.group(1)) if year_match else None
-        
-        raw_item_type = (item_data.get('type', 'misc') or 'misc').lower()
-        item_type = BetterBibTeXParser._ITEM_TYPE_MAP.get(raw_item_type, raw_item_type)
+        issued = get('issued')
+        if isinstance(issued, dict) and 'date-parts' in issued:
+            year_parts = issued['date-parts'][0] if issued['date-parts'] else None
+            year = year_parts[0] if year_parts else None
+        elif isinstance(issued, str):
+            year = _parse_year(issued, _WORD_YEAR_RE)
+        
+        item_type = BetterBibTeXParser._map_type(get('type') or 'misc')
 
         return ZoteroItem(
-            key=item_data.get('key', ''),
+            key=get('key', ''),
             citekey=citekey,
-            doi=item_data.get('DOI') or item_data.get('doi'),
-            url=item_data.get('URL') or item_data.get('url'),
-            title=item_data.get('title', ''),
+            doi=get('DOI') or get('doi'),
+            url=get('URL') or get('url'),
+            title=get('title', ''),
             authors=authors,
             year=year,
             item_type=item_type,
-            journal=item_data.get('publication') or item_data.get('journal'),
-            booktitle=item_data.get('bookTitle') or item_data.get('booktitle'),
-            publisher=item_data.get('publisher'),
-            volume=item_data.get('volume'),
-            issue=item_data.get('issue'),
-            pages=item_data.get('pages'),
-            abstract=item_data.get('abstract'),
-            tags=[t.get('tag') for t in item_data.get('tags', []) if isinstance(t, dict) and 'tag' in t],
-            raw_bibtex=item_data.get('raw_bibtex')
+            journal=get('publication') or get('journal'),
+            booktitle=get('bookTitle') or get('booktitle'),
+            publisher=get('publisher'),
+            volume=get('volume'),
+            issue=get('issue'),
+            pages=get('pages'),
+            abstract=get('abstract'),
+            tags=[sys.intern(t['tag']) for t in get('tags', ()) if isinstance(t, dict) and isinstance(t.get('tag'), str)],
+            raw_bibtex=get('raw_bibtex')
         )
 
 
@@ -231,12 +475,17 @@ class BibTeXFileParser:
     """Parse BibTeX (.bib) file format."""
     
     @staticmethod
-    def parse(bib_content: str) -> List[ZoteroItem]:
+    def parse(bib_content: Union[str, bytes]) -> List[ZoteroItem]:
         """
         Parse BibTeX file content.
         
+        Bytes are decoded as UTF-8 in one pass up front; a single bulk decode
+        is far cheaper than decoding each extracted value separately. Each
+        item's raw_bibtex is a lazy slice of the decoded content, which the
+        items keep a reference to.
+        
         Args:
-            bib_content: BibTeX file content as string
+            bib_content: BibTeX file content as string or UTF-8 bytes
             
         Returns:
             List of ZoteroItem objects
@@ -244,16 +493,19 @@ class BibTeXFileParser:
         Raises:
             ValueError: If parsing fails
         """
+        if isinstance(bib_content, (bytes, bytearray)):
+            bib_content = bib_content.decode('utf-8')
+        
         items = []
+        errors = Counter()
+        ext = _ext
         
         # Find all @Type{citekey, ... } entries
-        pattern = r'@(\w+)\s*{\s*([^,]+?)\s*,\s*(.*?)(?=@\w+\s*{|$)'
-        
-        for match in re.finditer(pattern, bib_content, re.IGNORECASE | re.DOTALL):
+        for head, end in _iter_entries(bib_content):
             try:
-                item_type = match.group(1).lower()
-                citekey = match.group(2).strip()
-                fields_str = match.group(3)
+                item_type = sys.intern(head.group(1).lower())
+                citekey = head.group(2).strip()
+                fields_str = bib_content[head.end():end]
                 
                 fields = BibTeXFileParser._parse_fields(fields_str)
                 
@@ -263,56 +515,115 @@ class BibTeXFileParser:
                     authors = BibTeXFileParser._parse_authors(fields['author'])
                 
                 # Extract year
-                year = None
-                if 'year' in fields:
-                    year_str = fields['year'].strip('{}')
-                    year_match = re.search(r'(20\d{2}|19\d{2})', year_str)
-                    year = int(year_match.group(1)) if year_match else None
+                year_text = ext(fields, 'year')
+                year = _parse_year(year_text) if year_text else None
                 
                 item = ZoteroItem(
                     key=citekey,
                     citekey=citekey,
-                    doi=fields.get('doi', '').strip('{}'),
-                    url=fields.get('url', '').strip('{}'),
-                    title=fields.get('title', '').strip('{}'),
+                    doi=ext(fields, 'doi'),
+                    url=ext(fields, 'url'),
+                    title=ext(fields, 'title') or '',
                     authors=authors,
                     year=year,
                     item_type=item_type,
-                    journal=fields.get('journal', '').strip('{}'),
-                    booktitle=fields.get('booktitle', '').strip('{}'),
-                    publisher=fields.get('publisher', '').strip('{}'),
-                    volume=fields.get('volume', '').strip('{}'),
-                    issue=fields.get('number', '').strip('{}'),
-                    pages=fields.get('pages', '').strip('{}'),
-                    abstract=fields.get('abstract', '').strip('{}'),
-                    raw_bibtex=match.group(0)
+                    journal=ext(fields, 'journal'),
+                    booktitle=ext(fields, 'booktitle'),
+                    publisher=ext(fields, 'publisher'),
+                    volume=ext(fields, 'volume'),
+                    issue=ext(fields, 'number'),
+                    pages=ext(fields, 'pages'),
+                    abstract=ext(fields, 'abstract')
                 )
+                item._raw_source = bib_content
+                item._raw_span = (head.start(), end)
                 items.append(item)
             
             except Exception as e:
-                print(f"Warning: Failed to parse BibTeX entry: {e}")
+                logger.debug("Failed to parse BibTeX entry %s: %s", head.group(2), e)
+                errors[type(e).__name__] += 1
+        
+        if errors:
+            logger.warning("Failed to parse %d BibTeX entry(ies): %s", sum(errors.values()), errors.most_common(5))
         
         return items
     
     @staticmethod
     def _parse_fields(fields_str: str) -> Dict[str, str]:
-        """Parse BibTeX field key-value pairs."""
-        fields = {}
-        
-        # Match key = value patterns (handles nested braces)
-        pattern = r'(\w+)\s*=\s*([{"].*?[}"]|[^,}]+)'
+        """
+        Parse BibTeX field key-value pairs.
         
-        for match in re.finditer(pattern, fields_str, re.IGNORECASE):
-            key = match.group(1).lower()
-            value = match.group(2).strip()
-            fields[key] = value
+        A single left-to-right scan: each "key =" is matched in place, then
+        the value is walked from one structural character to the next while
+        tracking brace depth, so nested groups such as {{CNN} and {RNN}} stay
+        intact. Values are returned without their outer braces or quotes.
+        """
+        fields = {}
+        s = fields_str
+        n = len(s)
+        pos = 0
+        
+        while pos < n:
+            key_match = _FIELD_KEY_RE.match(s, pos)
+            if key_match is None:
+                # Closing brace of the entry, or junk: resync at the next comma
+                pos = _FIELD_SEP_RE.match(s, pos).end()
+                if pos >= n or s[pos] == '}':
+                    break
+                pos = s.find(',', pos)
+                if pos < 0:
+                    break
+                continue
+            
+            key = key_match.group(1).lower()
+            pos = key_match.end()
+            if pos >= n:
+                break
+            
+            opener = s[pos]
+            if opener == '{' or opener == '"':
+                scanner = _BRACE_RE if opener == '{' else _QUOTED_VALUE_RE
+                depth = 1 if opener == '{' else 0
+                start = pos = pos + 1
+                end = n
+                while True:
+                    token = scanner.search(s, pos)
+                    if token is None:
+                        pos = n  # Unterminated value: take the rest
+                        break
+                    pos = token.end()
+                    char = token.group()
+                    if char == '{':
+                        depth += 1
+                    elif char == '}':
+                        depth -= 1
+                        if depth == 0 and opener == '{':
+                            end = pos - 1
+                            break
+                    elif depth <= 0:
+                        end = pos - 1  # Closing quote outside any braces
+                        break
+                value = s[start:end]
+            else:
+                token = _BARE_VALUE_END_RE.search(s, pos)
+                end = token.start() if token else n
+                value = s[pos:end]
+                pos = end
+            
+            fields[key] = value.strip()
         
         return fields
     
     @staticmethod
     def _parse_authors(author_str: str) -> List[str]:
         """Parse BibTeX author string (separated by 'and')."""
-        author_str = author_str.strip('{}')
+        if '{' in author_str:
+            # Protected groups such as {Barnes and Noble} are single names;
+            # a group spanning the whole name loses its braces
+            return [
+                _strip_braces(name) if name[0] == '{' else name
+                for name in _AUTHOR_RE.findall(author_str.strip())
+            ]
         authors = [a.strip() for a in author_str.split(' and ')]
         return authors
 
@@ -336,10 +647,28 @@ def parse_zotero_export(file_path: str, format_hint: Optional[str] = None) -> Li
     """
     path = Path(file_path)
     
-    if not path.exists():
-        raise FileNotFoundError(f"Zotero export not found: {file_path}")
-    
-    content = path.read_text(encoding='utf-8')
+    # Regular file: a single stat covers the common case
+    if path.is_file():
+        if format_hint is None:
+            format_hint = _FORMAT_BY_SUFFIX.get(path.suffix.lower())
+        
+        # JSON exports are streamed straight from the file
+        if format_hint == 'json':
+            with open(path, 'rb') as fp:
+                return BetterBibTeXParser.parse(fp)
+        
+        if format_hint == 'bibtex':
+            return BibTeXFileParser.parse(_read_utf8(path))
+        
+        if format_hint is not None:
+            raise ValueError(f"Unsupported format: {format_hint}")
+        
+        # Unknown extension: try JSON first, fall back to BibTeX
+        content = path.read_bytes()
+        try:
+            return BetterBibTeXParser.parse(content)
+        except ValueError:
+            return BibTeXFileParser.parse(content)
     
     # If directory given, prefer Better BibTeX JSON
     if path.is_dir():
@@ -353,23 +682,33 @@ def parse_zotero_export(file_path: str, format_hint: Optional[str] = None) -> Li
         else:
             raise FileNotFoundError(f"No Zotero export found in {file_path}")
     
-    # Auto-detect format
-    if format_hint is None:
-        if path.suffix.lower() == '.json':
-            format_hint = 'json'
-        elif path.suffix.lower() == '.bib':
-            format_hint = 'bibtex'
-        else:
-            # Try JSON first, fall back to BibTeX
-            try:
-                return BetterBibTeXParser.parse(content)
-            except Exception:
-                pass
+    raise FileNotFoundError(f"Zotero export not found: {file_path}")
+
+
+def parse_zotero_exports(file_paths: Iterable[str], max_workers: Optional[int] = None) -> List[ZoteroItem]:
+    """
+    Parse several Zotero export files, one worker process per file.
+    
+    Parsing is CPU-bound, so files are spread across processes rather than
+    threads. Items are returned in the order of ``file_paths``.
+    
+    Args:
+        file_paths: Paths to Zotero export files or directories
+        max_workers: Maximum worker processes (default: CPU count)
+        
+    Returns:
+        List of ZoteroItem objects from all files
+        
+    Raises:
+        FileNotFoundError: If a file is not found
+        ValueError: If a format is unsupported
+    """
+    paths = [str(p) for p in file_paths]
     
-    # Parse based on format
-    if format_hint == 'json':
-        return BetterBibTeXParser.parse(content)
-    elif format_hint == 'bibtex':
-        return BibTeXFileParser.parse(content)
+    if len(paths) <= 1 or max_workers == 1:
+        results = map(parse_zotero_export, paths)
     else:
-        raise ValueError(f"Unsupported format: {format_hint}")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(parse_zotero_export, paths))
+    
+    return [item for items in results for item in items]
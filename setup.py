@@ -21,7 +21,12 @@ setup(
         'python-docx==0.8.11',
         'markdown==3.5.1',
         'chromadb==0.4.22',
+        'numpy>=1.21',
         'requests==2.31.0',
         'cryptography==41.0.7',
     ],
+    extras_require={
+        # Faster (and streaming) JSON decoding for large Zotero exports
+        'fast': ['orjson>=3.8', 'ijson>=3.2'],
+    },
 )
\ No newline at end of file
@@ -77,6 +77,20 @@ def test_security_offline_mode():
         socket.socket()
 
 
+def test_security_offline_preserves_isinstance():
+    """Test that existing sockets still pass isinstance checks after patching."""
+    import socket
+    
+    real_socket = getattr(socket, '_real_socket', socket.socket)
+    sock = real_socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        SecurityContext(mode='offline')
+        assert isinstance(sock, socket.socket)
+        assert issubclass(real_socket, socket.socket)
+    finally:
+        sock.close()
+
+
 def test_security_egress_allowlist():
     """Test egress mode allowlist."""
     context = SecurityContext(
@@ -134,6 +148,7 @@ def test_audit_logging(temp_dir):
         num_results=5,
         execution_time_ms=100.5
     )
+    audit.flush()
     
     log_path = Path(log_file)
     assert log_path.exists()
@@ -143,6 +158,97 @@ def test_audit_logging(temp_dir):
     assert 'Test query' in content
 
 
+def test_audit_logging_batches_in_order(temp_dir):
+    """Test that batched audit events are written in order, once each."""
+    import json
+    
+    log_file = f'{temp_dir}/batch.log'
+    audit = get_audit_logger({'file': log_file, 'level': 'INFO'})
+    
+    for i in range(250):
+        audit.log_event({'event': 'test_event', 'seq': i})
+    audit.flush()
+    
+    events = [json.loads(line) for line in Path(log_file).read_text().splitlines()]
+    assert [e['seq'] for e in events] == list(range(250))
+    
+    quiet = get_audit_logger({'file': f'{temp_dir}/quiet.log', 'level': 'WARNING'})
+    quiet.log_query(query="Test query", num_results=1, execution_time_ms=1.0)
+    quiet.flush()
+    assert Path(f'{temp_dir}/quiet.log').read_text() == ''
+
+
+def test_audit_logging_survives_dropped_logger(temp_dir):
+    """Test that events queued by a discarded logger still reach disk."""
+    import gc
+    import time
+    
+    log_file = Path(f'{temp_dir}/dropped.log')
+    
+    def log_once():
+        audit = get_audit_logger({'file': str(log_file), 'level': 'INFO'})
+        audit.log_query(query="Dropped query", num_results=1, execution_time_ms=1.0)
+    
+    log_once()
+    gc.collect()
+    
+    deadline = time.monotonic() + 5
+    while 'Dropped query' not in log_file.read_text() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert 'Dropped query' in log_file.read_text()
+
+
+def test_audit_logging_keeps_events_on_write_error(temp_dir):
+    """Test that a failed flush keeps its events for the next attempt."""
+    log_file = Path(f'{temp_dir}/retry.log')
+    audit = get_audit_logger({'file': str(log_file), 'level': 'INFO'})
+    
+    # Make the log path unwritable by turning it into a directory
+    log_file.unlink()
+    log_file.mkdir()
+    audit.log_query(query="First query", num_results=1, execution_time_ms=1.0)
+    with pytest.raises(OSError):
+        audit.flush()
+    
+    log_file.rmdir()
+    audit.log_query(query="Second query", num_results=1, execution_time_ms=1.0)
+    audit.flush()
+    
+    content = log_file.read_text()
+    assert content.index('First query') < content.index('Second query')
+
+
+def test_security_http_check_fails_when_unblocked():
+    """Test that the HTTP check fails once sockets are no longer blocked."""
+    import socket
+    
+    patched = socket.socket
+    context = SecurityContext(mode='offline')
+    context._unpatch_socket()
+    try:
+        tester = SecuritySelfTest(context)
+        assert not tester.test_offline_http_blocked()
+        assert tester.results[-1][1] == 'FAILED'
+    finally:
+        socket.socket = patched
+
+
+def test_security_http_check_rejects_other_failures(monkeypatch):
+    """Test that request failures other than a blocked lookup are not counted as blocked."""
+    import requests
+    
+    context = SecurityContext(mode='offline')
+    
+    def timeout(*args, **kwargs):
+        raise requests.ConnectTimeout("connect timed out")
+    
+    monkeypatch.setattr(requests, 'get', timeout)
+    tester = SecuritySelfTest(context)
+    
+    assert not tester.test_offline_http_blocked()
+    assert tester.results[-1][1] == 'FAILED'
+
+
 def test_security_self_test():
     """Test security self-test suite."""
     context = SecurityContext(mode='offline')
@@ -159,5 +265,28 @@ def test_security_self_test():
     assert 'test_offline_socket_blocked' in result_names
 
 
+def test_security_self_test_times_out_stuck_checks():
+    """Test that a check stuck past the deadline fails without stalling the suite."""
+    import threading
+    import time
+    
+    release = threading.Event()
+    tester = SecuritySelfTest(SecurityContext(mode='offline'))
+    tester.TEST_TIMEOUT = 0.2
+    
+    def test_offline_http_blocked():
+        release.wait(5)
+        return True
+    
+    tester.test_offline_http_blocked = test_offline_http_blocked
+    try:
+        start = time.monotonic()
+        assert not tester.run_all_tests()
+        assert time.monotonic() - start < 2
+        assert ('test_offline_http_blocked', 'FAILED', 'Timed out after 0.2s') in tester.results
+    finally:
+        release.set()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -12,7 +12,6 @@ import pytest
 from rag_assistant.retrievers.web_retriever import QuerySanitizer, WebRetriever
 from rag_assistant.security import SecurityViolation
 from rag_assistant.audit.logger import AuditLogger
-import tempfile
 from pathlib import Path
 
 
@@ -96,6 +95,12 @@ class TestQuerySanitization:
         # Only alphanumeric and spaces
         assert all(c.isalnum() or c.isspace() for c in sanitized)
     
+    def test_quoted_strings_and_unicode(self):
+        """Test quoted spans are dropped and non-ASCII words are kept."""
+        assert QuerySanitizer.sanitize('Deep "secret phrase" networks: a survey!') == "deep networks a survey"
+        assert QuerySanitizer.sanitize('deep nets, it\'s "open') == "deep nets it s open"
+        assert QuerySanitizer.sanitize("deep Lernverfahren für Bäume!") == "deep lernverfahren für bäume"
+    
     def test_comments_blocked(self):
         """Test that comments are blocked."""
         blocked_queries = [
@@ -112,20 +117,54 @@ class TestQuerySanitization:
         assert QuerySanitizer.is_safe("machine learning")
         assert not QuerySanitizer.is_safe("/path/to/secret.txt")
         assert not QuerySanitizer.is_safe("SELECT * FROM users")
+    
+    def test_sanitize_is_memoized(self):
+        """Test repeated queries are served from the cache."""
+        QuerySanitizer.sanitize.cache_clear()
+        
+        first = QuerySanitizer.sanitize("graph neural networks")
+        assert QuerySanitizer.sanitize("graph neural networks") == first
+        assert QuerySanitizer.sanitize.cache_info().hits == 1
+        
+        # Blocked queries keep raising on every call
+        for _ in range(2):
+            with pytest.raises(SecurityViolation):
+                QuerySanitizer.sanitize("/path/to/secret.txt")
+    
+    def test_prefilter_never_hides_a_match(self):
+        """Test the trigger prefilter agrees with the full pattern scan."""
+        queries = [
+            "deep neural networks",
+            "ſELECT name FROM users",  # Long s folds to 's' under IGNORECASE
+            "d41d8cd98f00b204e9800998ecf8427e",
+            "hash d41d8cd98f00b204e9800998ecf8427e_x",
+            "notes -- internal",
+        ]
+        for query in queries:
+            full_scan = any(regex.search(query) for _, regex in QuerySanitizer._FORBIDDEN_COMPILED)
+            if full_scan:
+                assert QuerySanitizer._may_be_forbidden(query)
+            assert (QuerySanitizer._find_forbidden(query) is not None) == full_scan
+        
+        assert not QuerySanitizer._may_be_forbidden("machine learning transformers")
+    
+    def test_filter_batch(self):
+        """Test batch filtering keeps safe queries in order."""
+        queries = ["machine learning", "/path/to/secret.txt", "deep learning", "DELETE FROM logs"]
+        
+        assert QuerySanitizer.filter_batch(queries) == ["machine learning", "deep learning"]
 
 
 class TestWebRetrieverSecurity:
     """Tests for web retriever security controls."""
     
     @pytest.fixture
-    def web_retriever(self):
+    def web_retriever(self, tmp_path):
         """Create web retriever with test settings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            retriever = WebRetriever(
-                allowlist_domains=['arxiv.org', 'example.com'],
-                cache_dir=tmpdir
-            )
-            yield retriever
+        return WebRetriever(
+            allowlist_domains=['arxiv.org', 'example.com'],
+            cache_dir=str(tmp_path)
+        )
     
     def test_allowlist_enforcement(self, web_retriever):
         """Test that non-allowlisted domains are rejected."""
@@ -166,6 +205,24 @@ class TestWebRetrieverSecurity:
 
         assert len(results) == len(web_retriever.allowlist_domains)
 
+    def test_retrieve_fetches_domains_concurrently(self, web_retriever, monkeypatch):
+        """Test that domains are fetched in parallel and failures are isolated."""
+        import threading
+        
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def fetch(domain, query):
+            barrier.wait()  # Deadlocks (times out) if fetches run one by one
+            if domain == 'example.com':
+                raise RuntimeError("unreachable")
+            return [{'domain': domain, 'content': query}]
+        
+        monkeypatch.setattr(web_retriever, '_retrieve_from_domain', fetch)
+        
+        results = web_retriever.retrieve('machine learning')
+        
+        assert results == [{'domain': 'arxiv.org', 'content': 'machine learning'}]
+    
     def test_cache_storage_with_metadata(self, web_retriever):
         """Test that cached pages have correct metadata."""
         url = "https://example.com/page"
@@ -180,6 +237,17 @@ class TestWebRetrieverSecurity:
         assert doc['source_path'] == url
         assert doc['domain'] == domain
     
+    def test_cache_file_mode_follows_umask(self, web_retriever):
+        """Test that cache files get the same umask-based mode as files made with open()."""
+        import stat
+        
+        doc = web_retriever._cache_page("https://example.com/mode", "Test content", "example.com")
+        
+        reference = Path(web_retriever.cache_dir) / "reference.txt"
+        reference.write_text("")
+        cache_file = Path(web_retriever.cache_dir) / f"{doc['cache_key']}.json"
+        assert stat.S_IMODE(cache_file.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+    
     def test_no_internal_content_in_web_requests(self, web_retriever):
         """Test that internal document content cannot be sent in queries."""
         # Simulated "leak attempt" - trying to include internal text
@@ -202,13 +270,13 @@ class TestWebRetrieverSecurity:
 class TestPolicyEnforcement:
     """Tests for data exfiltration prevention policies."""
     
-    def test_cannot_mix_internal_and_web_retrieval(self):
+    def test_cannot_mix_internal_and_web_retrieval(self, tmp_path):
         """Test that internal content cannot be mixed with web queries."""
         from rag_assistant.retrievers.web_retriever import WebRetriever
         
         retriever = WebRetriever(
             allowlist_domains=['arxiv.org'],
-            cache_dir=tempfile.mkdtemp()
+            cache_dir=str(tmp_path)
         )
         
         # Try to construct query mixing internal and external
@@ -218,37 +286,34 @@ class TestPolicyEnforcement:
         with pytest.raises(SecurityViolation):
             retriever.retrieve(dangerous_query)
     
-    def test_audit_logs_all_web_requests(self):
+    def test_audit_logs_all_web_requests(self, tmp_path):
         """Test that all web requests are logged."""
         from rag_assistant.audit.logger import AuditLogger
-        import tempfile
-        import json
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = f"{tmpdir}/audit.log"
-            audit = AuditLogger(log_file=log_file)
-            
-            retriever = WebRetriever(
-                allowlist_domains=['arxiv.org'],
-                cache_dir=tmpdir,
-                audit_logger=audit
-            )
-            
-            # Simulate successful request
-            retriever._cache_page(
-                url="https://arxiv.org/search?q=test",
-                content="Test content",
-                domain="arxiv.org"
-            )
-            
-            # Check audit log exists
-            assert Path(log_file).exists()
+        log_file = tmp_path / "audit.log"
+        audit = AuditLogger(log_file=str(log_file))
+        
+        retriever = WebRetriever(
+            allowlist_domains=['arxiv.org'],
+            cache_dir=str(tmp_path),
+            audit_logger=audit
+        )
+        
+        # Simulate successful request
+        retriever._cache_page(
+            url="https://arxiv.org/search?q=test",
+            content="Test content",
+            domain="arxiv.org"
+        )
+        
+        # Check audit log exists
+        assert log_file.exists()
     
-    def test_web_results_marked_public(self):
+    def test_web_results_marked_public(self, tmp_path):
         """Test that all web results are marked as public."""
         retriever = WebRetriever(
             allowlist_domains=['example.com'],
-            cache_dir=tempfile.mkdtemp()
+            cache_dir=str(tmp_path)
         )
         
         doc = retriever._cache_page(
@@ -300,21 +365,19 @@ class TestPolicyEnforcement:
 class TestEndToEndSecurity:
     """End-to-end security tests for web retrieval."""
     
-    def test_isolated_cache_per_instance(self):
+    def test_isolated_cache_per_instance(self, tmp_path):
         """Test that cache directories are isolated."""
-        import tempfile
-        
-        with tempfile.TemporaryDirectory() as dir1:
-            with tempfile.TemporaryDirectory() as dir2:
-                r1 = WebRetriever(['example.com'], cache_dir=dir1)
-                r2 = WebRetriever(['example.com'], cache_dir=dir2)
-                
-                doc1 = r1._cache_page("https://example.com/1", "Content 1", "example.com")
-                doc2 = r2._cache_page("https://example.com/2", "Content 2", "example.com")
-                
-                # Different caches
-                assert Path(dir1).exists()
-                assert Path(dir2).exists()
+        dir1 = tmp_path / "cache1"
+        dir2 = tmp_path / "cache2"
+        r1 = WebRetriever(['example.com'], cache_dir=str(dir1))
+        r2 = WebRetriever(['example.com'], cache_dir=str(dir2))
+        
+        doc1 = r1._cache_page("https://example.com/1", "Content 1", "example.com")
+        doc2 = r2._cache_page("https://example.com/2", "Content 2", "example.com")
+        
+        # Different caches
+        assert dir1.exists()
+        assert dir2.exists()
     
     def test_query_sanitization_idempotent(self):
         """Test that sanitization is idempotent."""
@@ -325,14 +388,13 @@ class TestEndToEndSecurity:
         
         assert sanitized1 == sanitized2
     
-    def test_concurrent_safety(self):
+    def test_concurrent_safety(self, tmp_path):
         """Test thread safety of cache operations."""
         import threading
-        import tempfile
         
         retriever = WebRetriever(
             allowlist_domains=['example.com'],
-            cache_dir=tempfile.mkdtemp()
+            cache_dir=str(tmp_path)
         )
         
         results = []
@@ -356,6 +418,33 @@ class TestEndToEndSecurity:
         # All threads completed successfully
         assert len(results) == 5
 
+    def test_concurrent_writes_same_url(self, tmp_path):
+        """Test that racing writers leave one complete cache file."""
+        import threading
+        
+        retriever = WebRetriever(
+            allowlist_domains=['example.com'],
+            cache_dir=str(tmp_path)
+        )
+        url = "https://example.com/same"
+        
+        threads = [
+            threading.Thread(
+                target=retriever._cache_page,
+                args=(url, f"Content {i}" * 200, "example.com")
+            )
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        cached = retriever._get_cached_page(url)
+        assert cached is not None
+        assert cached['source_path'] == url
+        assert [p.name for p in tmp_path.iterdir()] == [f"{cached['cache_key']}.json"]
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '-s'])
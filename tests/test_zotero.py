@@ -1,17 +1,21 @@
 """Tests for Zotero citation management."""
 
 import pytest
+import io
 import json
 import tempfile
 from pathlib import Path
 from rag_assistant.zotero import (
     parse_zotero_export,
+    parse_zotero_exports,
     ZoteroItem,
     CitationIndex,
     BibTeXFormatter,
-    FormattedCitationFormatter
+    FormattedCitationFormatter,
+    items_to_bibtex
 )
 from rag_assistant.zotero.parser import BetterBibTeXParser, BibTeXFileParser
+import rag_assistant.zotero.parser as parser_module
 
 
 # Sample Better BibTeX JSON export
@@ -98,6 +102,73 @@ class TestBetterBibTeXParser:
         assert len(items) == 2
         assert items[0].citekey == "Doe2023"
     
+    def test_parse_json_bytes(self):
+        """Test parsing raw UTF-8 bytes, as read from an export file."""
+        payload = json.dumps({"items": SAMPLE_BETTER_BIBTEX_JSON}).encode()
+        items = BetterBibTeXParser.parse(payload)
+        
+        assert [item.citekey for item in items] == ["Doe2023", "Lewis2020"]
+        assert items[0].year == 2023
+    
+    def test_parse_json_stream(self):
+        """Test streaming items from a binary file object."""
+        payload = json.dumps({"items": SAMPLE_BETTER_BIBTEX_JSON}).encode()
+        items = list(BetterBibTeXParser.iter_parse(io.BytesIO(payload)))
+        
+        assert [item.citekey for item in items] == ["Doe2023", "Lewis2020"]
+    
+    def test_parse_json_stream_with_ijson(self, monkeypatch):
+        """Test the incremental ijson path, including malformed exports."""
+        ijson = pytest.importorskip("ijson")
+        monkeypatch.setattr(parser_module, "ijson", ijson)
+        
+        for payload in (SAMPLE_BETTER_BIBTEX_JSON, {"config": {}, "items": SAMPLE_BETTER_BIBTEX_JSON}):
+            stream = io.BytesIO(json.dumps(payload).encode())
+            items = list(BetterBibTeXParser.iter_parse(stream))
+            assert [item.citekey for item in items] == ["Doe2023", "Lewis2020"]
+        
+        assert list(BetterBibTeXParser.iter_parse(io.BytesIO(b'{"items": []}'))) == []
+        
+        with pytest.raises(ValueError, match="'items' key"):
+            list(BetterBibTeXParser.iter_parse(io.BytesIO(b'{"config": {"items": []}}')))
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            list(BetterBibTeXParser.iter_parse(io.BytesIO(b'[{"key": ')))
+    
+    def test_item_type_and_tags(self):
+        """Test item type mapping and tag extraction."""
+        data = [
+            {"citationKey": "A", "type": "Journal-Article", "tags": [{"tag": "ml"}, {"tag": 3}]},
+            {"citationKey": "B", "type": "conference", "tags": [{"tag": "ml"}]},
+        ]
+        items = BetterBibTeXParser.parse(data)
+        
+        assert items[0].item_type == "article"
+        assert items[1].item_type == "conference"
+        assert items[0].tags == ["ml"]
+        assert items[0].tags[0] is items[1].tags[0]
+    
+    def test_malformed_items_summarized(self, caplog):
+        """Test that malformed items are skipped with one summary warning."""
+        data = SAMPLE_BETTER_BIBTEX_JSON + [{"key": "bad-1", "creators": 5}, {"key": "bad-2", "creators": 7}]
+        
+        with caplog.at_level("WARNING", logger="rag_assistant.zotero.parser"):
+            items = BetterBibTeXParser.parse(data)
+        
+        assert len(items) == 2
+        assert len(caplog.records) == 1
+        assert "Failed to parse 2 item(s)" in caplog.records[0].getMessage()
+    
+    def test_issued_date_strings(self):
+        """Test year extraction from free-form issued dates."""
+        data = [
+            {"citationKey": "A", "issued": "2021-06-01"},
+            {"citationKey": "B", "issued": "Spring 1999"},
+            {"citationKey": "C", "issued": "12023"},
+        ]
+        items = BetterBibTeXParser.parse(data)
+        
+        assert [item.year for item in items] == [2021, 1999, None]
+    
     def test_parse_json_invalid(self):
         """Test error handling for invalid JSON."""
         with pytest.raises(ValueError):
@@ -139,6 +210,14 @@ class TestBibTeXFileParser:
         assert "Doe, John" in item1.authors
         assert "Smith, Jane" in item1.authors
     
+    def test_author_parsing_protected_group(self):
+        """Test that braced corporate authors are kept whole."""
+        authors = BibTeXFileParser._parse_authors("{Barnes and Noble} and Doe, John")
+        
+        assert authors == ["Barnes and Noble", "Doe, John"]
+        assert BibTeXFileParser._parse_authors("{World Health Organization}") == ["World Health Organization"]
+        assert BibTeXFileParser._parse_authors("{van} Dyke, Ann") == ["{van} Dyke, Ann"]
+    
     def test_conference_paper_parsing(self):
         """Test conference paper parsing."""
         items = BibTeXFileParser.parse(SAMPLE_BIBTEX)
@@ -147,6 +226,80 @@ class TestBibTeXFileParser:
         assert item2.item_type == "inproceedings"
         assert item2.booktitle == "Proceedings of NeurIPS"
 
+    def test_nested_braces_and_quoted_values(self):
+        """Test that nested brace groups and quoted values are parsed whole."""
+        content = (
+            '@article{Nested2022,\n'
+            '  title = {{CNN} and {RNN} Models},\n'
+            '  journal = "Journal of {AI}",\n'
+            '  year = 2022\n'
+            '}\n'
+        )
+        items = BibTeXFileParser.parse(content)
+        
+        assert len(items) == 1
+        assert items[0].title == "{CNN} and {RNN} Models"
+        assert items[0].journal == "Journal of {AI}"
+        assert items[0].year == 2022
+        assert items[0].doi is None
+        assert items[0].pages is None
+    
+    def test_parse_bibtex_bytes(self):
+        """Test parsing UTF-8 encoded BibTeX content."""
+        content = SAMPLE_BIBTEX.replace("Doe, John", "Dö, John").encode("utf-8")
+        items = BibTeXFileParser.parse(content)
+        
+        assert len(items) == 2
+        assert items[0].authors[0] == "Dö, John"
+    
+    def test_item_type_interned(self):
+        """Test that entries of the same type share one item_type string."""
+        items = BibTeXFileParser.parse("@ARTICLE{A, title={x}}\n@article{B, title={y}}\n")
+        
+        assert [item.item_type for item in items] == ["article", "article"]
+        assert items[0].item_type is items[1].item_type
+    
+    def test_raw_bibtex_slices_source(self):
+        """Test that parsed entries expose their exact source text."""
+        items = BibTeXFileParser.parse(SAMPLE_BIBTEX)
+        
+        assert items[1].raw_bibtex == SAMPLE_BIBTEX[SAMPLE_BIBTEX.index("@inproceedings"):]
+        assert items[1].to_bibtex() == items[1].raw_bibtex
+        assert ZoteroItem(key="k", citekey="K", raw_bibtex="@misc{K}").raw_bibtex == "@misc{K}"
+    
+    def test_raw_bibtex_survives_replace(self):
+        """Test that dataclasses.replace keeps the raw entry without the whole file."""
+        import dataclasses
+        
+        item = BibTeXFileParser.parse(SAMPLE_BIBTEX)[1]
+        
+        copy = dataclasses.replace(item, title="Changed")
+        assert copy.title == "Changed"
+        assert copy.raw_bibtex == item.raw_bibtex
+        assert copy._raw_source is not SAMPLE_BIBTEX
+        assert dataclasses.replace(item, raw_bibtex="@misc{X}").raw_bibtex == "@misc{X}"
+        
+        with pytest.raises(TypeError):
+            ZoteroItem(key="k", citekey="K", _raw_source=SAMPLE_BIBTEX)
+    
+    def test_entry_without_citekey_does_not_swallow_next(self):
+        """Test that a comma-less block ends at the next entry."""
+        content = "@comment{ exported from Zotero }\n" + SAMPLE_BIBTEX
+        items = BibTeXFileParser.parse(content)
+        
+        assert [item.citekey for item in items] == ["Doe2023", "Lewis2020"]
+    
+    def test_string_comment_preamble_skipped(self):
+        """Test that @string/@comment/@preamble blocks are not parsed as items."""
+        content = (
+            '@String{ieee = "IEEE, Inc."}\n'
+            '@comment{jabref-meta: groups, tree}\n'
+            '@preamble{"\\newcommand{\\x}{a, b}"}\n'
+        ) + SAMPLE_BIBTEX
+        items = BibTeXFileParser.parse(content)
+        
+        assert [item.citekey for item in items] == ["Doe2023", "Lewis2020"]
+
 
 class TestZoteroItemConversion:
     """Tests for ZoteroItem conversion."""
@@ -173,6 +326,41 @@ class TestZoteroItemConversion:
         assert "year = {2023}" in bibtex
         assert "journal = {Test Journal}" in bibtex
     
+    def test_to_bibtex_exact_layout(self):
+        """Test field order and trailing-comma handling of BibTeX output."""
+        item = ZoteroItem(
+            key="test-1",
+            citekey="Test2023",
+            title="Test Paper",
+            authors=["John Doe"],
+            year=2023,
+            item_type="article",
+            doi="10.1/x"
+        )
+        
+        assert item.to_bibtex() == (
+            "@article{Test2023,\n"
+            "  title = {Test Paper},\n"
+            "  author = {John Doe},\n"
+            "  year = {2023},\n"
+            "  doi = {10.1/x}\n"
+            "}"
+        )
+    
+    def test_to_bibtex_without_fields(self):
+        """Test BibTeX output for an entry with no optional fields."""
+        item = ZoteroItem(key="test-1", citekey="Empty2023", item_type="misc")
+        
+        assert item.to_bibtex() == "@misc{Empty2023\n}"
+    
+    def test_items_are_slotted(self):
+        """Test that items carry no per-instance __dict__."""
+        item = ZoteroItem(key="test-1", citekey="Slots2023", item_type="misc")
+        
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.not_a_field = 1
+    
     def test_short_citation(self):
         """Test short citation generation."""
         item = ZoteroItem(
@@ -241,6 +429,31 @@ class TestCitationIndex:
         assert len(results) > 0
         assert results[0].citekey == "Lewis2020"
     
+    def test_search_no_match(self, index_with_items):
+        """Test that unmatched queries return nothing."""
+        assert index_with_items.search("quantum chromodynamics") == []
+        assert index_with_items.search("xyz") == []
+    
+    def test_search_key_contained_in_query(self, index_with_items):
+        """Test that a title contained in a longer query still matches."""
+        results = index_with_items.search("Lewis on Retrieval-Augmented Generation")
+        
+        assert [r.citekey for r in results] == ["Lewis2020"]
+    
+    def test_search_large_index(self):
+        """Test substring matches in both directions on an index large enough for postings."""
+        index = CitationIndex()
+        index.add_items([
+            ZoteroItem(key=str(i), citekey=f"Key{i}", title=f"Study number {i} of sparse topics")
+            for i in range(50)
+        ])
+        index.add_item(ZoteroItem(key="q", citekey="Quantum", title="Quantum Chromodynamics"))
+        
+        assert [r.citekey for r in index.search("chromodynamics")] == ["Quantum"]
+        assert [r.citekey for r in index.search("A review of quantum chromodynamics today")] == ["Quantum"]
+        assert [r.citekey for r in index.search("number 4", limit=3)] == ["Key4", "Key40", "Key41"]
+        assert [r.citekey for r in index.search_advanced(title="chromo")] == ["Quantum"]
+    
     def test_search_limit(self, index_with_items):
         """Test search result limiting."""
         results = index_with_items.search("", limit=1)
@@ -253,6 +466,36 @@ class TestCitationIndex:
         
         assert len(results) > 0
         assert all(r.year == 2023 for r in results)
+    
+    def test_advanced_search_item_type(self, index_with_items):
+        """Test filtering by item type combined with year."""
+        assert [r.citekey for r in index_with_items.search_advanced(item_type="article")] == ["Doe2023"]
+        assert index_with_items.search_advanced(item_type="article", year=2020) == []
+        assert index_with_items.search_advanced(item_type="thesis") == []
+    
+    def test_advanced_search_out_of_range_year(self):
+        """Test that years the year column cannot hold match nothing."""
+        index = CitationIndex()
+        index.add_items([
+            ZoteroItem(key="1", citekey="Undated", title="No year"),
+            ZoteroItem(key="2", citekey="Dated", title="Has year", year=2020),
+        ])
+        
+        assert index.search_advanced(year=-1) == []
+        assert index.search_advanced(year=40000) == []
+        assert index.search_advanced(year="2020") == []
+    
+    def test_advanced_search_many_items(self):
+        """Test year filtering beyond the initial column capacity, in insertion order."""
+        index = CitationIndex()
+        index.add_items([
+            ZoteroItem(key=str(i), citekey=f"Key{i}", title=f"Paper {i}", year=2000 + i % 3)
+            for i in range(100)
+        ])
+        
+        results = index.search_advanced(year=2001)
+        
+        assert [r.citekey for r in results] == [f"Key{i}" for i in range(1, 100, 3)]
 
 
 class TestBibTeXFormatter:
@@ -277,6 +520,25 @@ class TestBibTeXFormatter:
         
         assert "Generated by" not in bibtex
         assert "@" in bibtex
+    
+    def test_items_to_bibtex(self):
+        """Test bulk rendering of entries separated by blank lines."""
+        items = BetterBibTeXParser.parse(SAMPLE_BETTER_BIBTEX_JSON)
+        
+        bibtex = items_to_bibtex(items)
+        
+        assert bibtex == items[0].to_bibtex() + "\n\n" + items[1].to_bibtex() + "\n"
+        assert items_to_bibtex([]) == ""
+
+    def test_generate_from_citekeys(self):
+        """Test generation skips unknown citekeys and keeps request order."""
+        index = CitationIndex()
+        items = BetterBibTeXParser.parse(SAMPLE_BETTER_BIBTEX_JSON)
+        index.add_items(items)
+        
+        bibtex = BibTeXFormatter.generate_from_citekeys(index, ["Lewis2020", "Missing", "Doe2023"])
+        
+        assert bibtex == BibTeXFormatter.generate([items[1], items[0]])
 
 
 class TestFormattedCitationFormatter:
@@ -344,6 +606,63 @@ class TestFileFormatDetection:
             
             assert len(items) == 2
             assert items[0].citekey == "Doe2023"
+    
+    def test_parse_directory_prefers_json(self):
+        """Test that a directory resolves to its Better BibTeX JSON export."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "zotero.json").write_text(json.dumps(SAMPLE_BETTER_BIBTEX_JSON))
+            (Path(tmpdir) / "bibliography.bib").write_text(SAMPLE_BIBTEX)
+            
+            items = parse_zotero_export(tmpdir)
+            
+            assert len(items) == 2
+            assert items[0].authors == ["John Doe", "Jane Smith"]
+    
+    def test_unknown_extension_falls_back_to_bibtex(self):
+        """Test that content that is not JSON is parsed as BibTeX."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export = Path(tmpdir) / "library.txt"
+            export.write_text(SAMPLE_BIBTEX)
+            
+            items = parse_zotero_export(str(export))
+            
+            assert [item.citekey for item in items] == ["Doe2023", "Lewis2020"]
+    
+    def test_missing_export(self):
+        """Test error for a missing export path."""
+        with pytest.raises(FileNotFoundError):
+            parse_zotero_export("/nonexistent/zotero.json")
+    
+    def test_empty_bibtex_file(self):
+        """Test that an empty .bib file (which cannot be mapped) parses to nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_file = Path(tmpdir) / "empty.bib"
+            bib_file.write_bytes(b"")
+            
+            assert parse_zotero_export(str(bib_file)) == []
+    
+    def test_bibtex_file_crlf_line_endings(self):
+        """Test that Windows line endings are normalized when reading a .bib file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_file = Path(tmpdir) / "windows.bib"
+            bib_file.write_bytes(SAMPLE_BIBTEX.replace("\n", "\r\n").encode())
+            
+            items = parse_zotero_export(str(bib_file))
+            
+            assert items == BibTeXFileParser.parse(SAMPLE_BIBTEX)
+            assert all("\r" not in item.raw_bibtex for item in items)
+    
+    def test_parse_multiple_exports(self):
+        """Test parsing several export files in parallel, preserving order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_file = Path(tmpdir) / "references.bib"
+            bib_file.write_text(SAMPLE_BIBTEX)
+            json_file = Path(tmpdir) / "zotero.json"
+            json_file.write_text(json.dumps(SAMPLE_BETTER_BIBTEX_JSON[:1]))
+            
+            items = parse_zotero_exports([bib_file, json_file], max_workers=2)
+            
+            assert [item.citekey for item in items] == ["Doe2023", "Lewis2020", "Doe2023"]
 
 
 class TestIntegration: